@@ -1,7 +1,7 @@
 from dataclasses import dataclass, fields, astuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     title: str
     description: str
@@ -18,4 +18,4 @@ class Product:
         return [field.name for field in fields(cls)]
 
 
-PRODUCT_FIELDS = [field.name for field in fields(Product)]
\ No newline at end of file
+PRODUCT_FIELDS = ("title", "description", "price", "rating", "num_of_reviews", "additional_info")
\ No newline at end of file
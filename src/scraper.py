@@ -1,29 +1,35 @@
-from typing import List
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Tuple
 from urllib.parse import urljoin
+import aiohttp
 import requests
-from bs4 import BeautifulSoup, Tag
-from fake_useragent import UserAgent
+from aiohttp_retry import ExponentialRetry, RetryClient
 from requests.adapters import HTTPAdapter
+from selectolax.parser import HTMLParser, Node
 from urllib3.util.retry import Retry
 from models import Product
 from utils.logger import setup_logger
-from utils.selenium_utils import parse_hdd_block_prices
 
 logger = setup_logger(__name__)
 
 # Session setup
-user_agent = UserAgent()
-retry_strategy = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504], allowed_methods=["GET"])
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36")
+retry_strategy = Retry(total=3, backoff_factor=0.5, backoff_jitter=0.5, respect_retry_after_header=True,
+                       status_forcelist=[429, 500, 502, 503, 504], allowed_methods=["GET"], raise_on_status=False)
+adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=32, pool_maxsize=32, pool_block=False)
 session = requests.Session()
-session.mount("https://", HTTPAdapter(max_retries=retry_strategy))
-session.mount("http://", HTTPAdapter(max_retries=retry_strategy))
+session.mount("https://", adapter)
+session.mount("http://", adapter)
 
 BASE_URL = "https://webscraper.io/"
 HOME_URL = urljoin(BASE_URL, "test-sites/e-commerce/allinone/")
 LAPTOP_URL = urljoin(BASE_URL, "test-sites/e-commerce/static/computers/laptops/")
 
 HEADERS = {
-    'User-Agent': user_agent.random,
+    'User-Agent': USER_AGENT,
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
     'Accept-Language': 'en-US,en;q=0.5',
     'Connection': 'keep-alive',
@@ -31,18 +37,46 @@ HEADERS = {
 }
 
 
+# CSS-селектори гарячого шляху парсингу, визначені один раз на рівні модуля
+SELECTOR_CARD = ".card-body"
+SELECTOR_TITLE = ".title"
+SELECTOR_DESCRIPTION = ".description"
+SELECTOR_PRICE = ".price"
+SELECTOR_RATING = "[data-rating]"
+SELECTOR_REVIEW_COUNT = ".review-count"
+SELECTOR_PAGINATION = ".pagination"
+SELECTOR_HDD_BUTTONS = ".swatches button:not([disabled])"
+
+# Таблиця для видалення символів валюти з цін без створення проміжних рядків
+PRICE_STRIP = str.maketrans("", "", "$,")
+
+
+# Кеш діє в межах одного запуску: сторінки обробляються потоками одного процесу,
+# тому повторні URL товарів між сторінками не завантажуються вдруге
+@lru_cache(maxsize=4096)
+def _hdd_prices_for_url(url: str) -> Tuple[Tuple[str, float], ...]:
+    response = session.get(url, headers=HEADERS, timeout=10, verify=True)
+    response.raise_for_status()
+    tree = HTMLParser(response.content, detect_encoding=False)
+    return tuple(
+        (button.attributes["value"], float(button.attributes["data-price"]))
+        for button in tree.css(SELECTOR_HDD_BUTTONS)
+    )
+
+
 class WebScraper:
     def __init__(self):
         self.session = session
         self.headers = HEADERS
         self.base_url = BASE_URL
+        self.executor = ThreadPoolExecutor(max_workers=8)
 
     def get_home_products(self) -> List[Product]:
         try:
             response = self.session.get(HOME_URL, headers=self.headers, timeout=10, verify=True)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, features="html.parser")
-            products = soup.select(".card-body")
+            tree = HTMLParser(response.content, detect_encoding=False)
+            products = tree.css(SELECTOR_CARD)
             return [self.parse_single_product(product) for product in products]
         except requests.exceptions.RequestException as e:
             logger.error(f"Помилка при виконанні запиту до HOME_URL: {e}")
@@ -51,49 +85,65 @@ class WebScraper:
             logger.warning(f"Неочікувана помилка в get_home_products(): {e}")
             return []
 
-    def parse_single_product(self, product: Tag) -> Product:
-        hdd_prices = parse_hdd_block_prices(product)
+    def parse_hdd_block_prices(self, product: Node) -> Dict[str, float]:
+        absolute_url = urljoin(self.base_url, product.css_first(SELECTOR_TITLE).attributes["href"])
+        return dict(_hdd_prices_for_url(absolute_url))
+
+    def parse_single_product(self, product: Node) -> Product:
+        hdd_prices = self.parse_hdd_block_prices(product)
         return Product(
-            title=product.select_one(".title")["title"],
-            description=product.select_one(".description").text,
-            price=float(product.select_one(".price").text.replace("$", "")),
-            rating=int(product.select_one("[data-rating]")["data-rating"]),
-            num_of_reviews=int(product.select_one(".review-count").text.split()[0]),
+            title=product.css_first(SELECTOR_TITLE).attributes["title"],
+            description=product.css_first(SELECTOR_DESCRIPTION).text(),
+            price=float(product.css_first(SELECTOR_PRICE).text().translate(PRICE_STRIP)),
+            rating=int(product.css_first(SELECTOR_RATING).attributes["data-rating"]),
+            num_of_reviews=int(product.css_first(SELECTOR_REVIEW_COUNT).text().partition(" ")[0]),
             additional_info={"hdd_prices": hdd_prices}
         )
 
-    def get_laptop_page_products(self) -> List[Product]:
-        try:
-            response = self.session.get(LAPTOP_URL, headers=self.headers, timeout=10, verify=True)
+    async def _fetch_page(self, client: RetryClient, page_num: int) -> bytes:
+        async with client.get(LAPTOP_URL, params={"page": page_num}) as response:
             response.raise_for_status()
-            first_page_soup = BeautifulSoup(response.content, features="html.parser")
-            all_products = self.get_single_page_products(first_page_soup)
-            num_pages = self.get_num_pages(first_page_soup)
-            logger.info(f"Всього знайдено сторінок: {num_pages}")
-            logger.info(f"Початок парсингу сторінки 1 з {num_pages}")
+            return await response.read()
+
+    async def get_laptop_page_products(self) -> List[Product]:
+        try:
+            retry_options = ExponentialRetry(attempts=3, statuses={429, 500, 502, 503, 504},
+                                             exceptions={aiohttp.ClientConnectorError, asyncio.TimeoutError})
+            connector = aiohttp.TCPConnector(limit=10)
+            timeout = aiohttp.ClientTimeout(total=10)
+            async with aiohttp.ClientSession(headers=self.headers, connector=connector, timeout=timeout) as aio_session:
+                client = RetryClient(client_session=aio_session, retry_options=retry_options)
+                first_page_content = await self._fetch_page(client, 1)
+                first_page_tree = HTMLParser(first_page_content, detect_encoding=False)
+                all_products, num_pages = self.parse_first_page(first_page_tree)
+                logger.info(f"Всього знайдено сторінок: {num_pages}")
+                logger.info(f"Початок парсингу сторінки 1 з {num_pages}")
 
-            for page_num in range(2, num_pages + 1):
+                pages_content = await asyncio.gather(
+                    *[self._fetch_page(client, page_num) for page_num in range(2, num_pages + 1)]
+                )
+
+            for page_num, page_content in enumerate(pages_content, start=2):
                 logger.info(f"Початок парсингу сторінки {page_num} з {num_pages}")
-                response = self.session.get(LAPTOP_URL, headers=self.headers, params={"page": page_num}, timeout=10,
-                                            verify=True)
-                response.raise_for_status()
-                next_page_soup = BeautifulSoup(response.content, features="html.parser")
-                page_products = self.get_single_page_products(next_page_soup)
+                next_page_tree = HTMLParser(page_content, detect_encoding=False)
+                page_products = self.get_single_page_products(next_page_tree)
                 all_products.extend(page_products)
 
             logger.info(f"Всього знайдено товарів: {len(all_products)}")
             return all_products
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             logger.error(f"Помилка при завантаженні сторінок: {e}")
             return []
         except Exception as e:
             logger.warning(f"Неочікувана помилка: {e}")
             return []
 
-    def get_num_pages(self, page_soup: Tag) -> int:
-        pagination = page_soup.select_one(".pagination")
-        return int(pagination.select("li")[-2].text) if pagination else 1
+    def parse_first_page(self, page_tree: HTMLParser) -> Tuple[List[Product], int]:
+        products = self.get_single_page_products(page_tree)
+        pagination = page_tree.css_first(SELECTOR_PAGINATION)
+        num_pages = int(pagination.css("li")[-2].text()) if pagination else 1
+        return products, num_pages
 
-    def get_single_page_products(self, page_soup: Tag) -> List[Product]:
-        products = page_soup.select(".card-body")
-        return [self.parse_single_product(product) for product in products]
\ No newline at end of file
+    def get_single_page_products(self, page_tree: HTMLParser) -> List[Product]:
+        products = page_tree.css(SELECTOR_CARD)
+        return list(self.executor.map(self.parse_single_product, products))
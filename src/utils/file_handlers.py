@@ -1,8 +1,17 @@
-import csv
 import os
 from typing import List
 from models import Product, PRODUCT_FIELDS
 
+# Символи, після яких поле потрібно брати в лапки за правилами CSV
+_NEEDS_QUOTING = ('"', ',', '\n', '\r')
+
+
+def _format_field(value) -> str:
+    text = str(value)
+    if any(char in text for char in _NEEDS_QUOTING):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
 
 def write_products_to_csv(products: List[Product]) -> None:
     # Визначаємо шлях до data відносно кореня проєкту
@@ -11,7 +20,16 @@ def write_products_to_csv(products: List[Product]) -> None:
     # Створюємо директорію data, якщо вона не існує
     os.makedirs(os.path.dirname(csv_path), exist_ok=True)
 
-    with open(csv_path, "w", newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(PRODUCT_FIELDS)
-        writer.writerows([product.to_tuple() for product in products])
\ No newline at end of file
+    with open(csv_path, "wb", buffering=1 << 20) as f:
+        f.write((",".join(PRODUCT_FIELDS) + "\r\n").encode("utf-8"))
+        f.write(b"".join(
+            ",".join((
+                _format_field(product.title),
+                _format_field(product.description),
+                str(product.price),
+                str(product.rating),
+                str(product.num_of_reviews),
+                _format_field(product.additional_info),
+            )).encode("utf-8") + b"\r\n"
+            for product in products
+        ))